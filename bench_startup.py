@@ -0,0 +1,73 @@
+import os
+import sys
+import time
+import argparse
+import subprocess
+import statistics
+
+# Modules that must stay out of the fast paths (`--help`, structure-only).
+HEAVY_MODULES = ("ollama", "requests", "colorama", "httpx", "describer", "downloader", "renderer")
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+MAIN = os.path.join(HERE, "main.py")
+# A small, fixed tree so the structure-only run measures startup, not walking.
+DEFAULT_TARGET = os.path.join(HERE, "draft-files")
+
+def measure_importtime(args):
+    """Run main.py under `python -X importtime` and return (returncode, total_us, loaded module names)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", MAIN, *args],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    total_us = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        # Format: "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules.add(name.strip())
+        # Top-level imports are not indented; summing them gives the total.
+        if not name.startswith("  "):
+            total_us += int(cumulative)
+    return result.returncode, total_us, modules
+
+def measure_wall_time(args, runs):
+    """Return the median wall-clock time in milliseconds over several runs, or None if any run failed."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, MAIN, *args], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append((time.perf_counter() - start) * 1000)
+        if result.returncode != 0:
+            return None
+    return statistics.median(timings)
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure GitNoodle startup time.")
+    parser.add_argument("-n", "--runs", type=int, default=10, help="wall-clock runs per scenario (default: %(default)s)")
+    parser.add_argument("--target", default=DEFAULT_TARGET, help="local directory for the structure-only run (default: draft-files)")
+    args = parser.parse_args()
+
+    scenarios = {
+        "--help": ["--help"],
+        "structure-only": ["--structure-only", args.target],
+    }
+
+    failed = False
+    print(f"{'scenario':<16} {'imports':>10} {'wall (median)':>14}  heavy modules loaded")
+    for name, scenario_args in scenarios.items():
+        returncode, total_us, modules = measure_importtime(scenario_args)
+        wall_ms = measure_wall_time(scenario_args, args.runs) if returncode == 0 else None
+        if wall_ms is None:
+            print(f"{name:<16} FAILED (exit status {returncode or 'non-zero on a timed run'})")
+            failed = True
+            continue
+        heavy = sorted(m for m in modules if m.split(".")[0] in HEAVY_MODULES)
+        print(f"{name:<16} {total_us / 1000:>8.1f}ms {wall_ms:>12.1f}ms  {', '.join(heavy) or 'none'}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
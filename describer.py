@@ -0,0 +1,47 @@
+import os
+import ollama
+
+DEFAULT_MODEL = "llama3.2"
+
+def generate_description_with_ollama(content, model=DEFAULT_MODEL):
+    """Generate a simple, one-line description using Ollama."""
+    try:
+        response = ollama.generate(
+            model=model,  # Use the desired Ollama model
+            prompt=f"Describe the purpose of the following code or file in one short sentence:\n\n{content}\n\nDescription:"
+        )
+        return response["response"].strip()
+    except Exception as e:
+        print(f"Error generating description with Ollama: {e}")
+        return None
+
+def extract_file_description(file_path, model=None):
+    """Extract a simple description from file content using Ollama."""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        
+        # Generate a simple description using Ollama
+        description = generate_description_with_ollama(content, model or DEFAULT_MODEL)
+        return description
+    except Exception:
+        return None
+
+def extract_directory_description(dir_path):
+    """Extract a simple description from a README.md or DESCRIPTION.txt file."""
+    readme_path = os.path.join(dir_path, "README.md")
+    description_path = os.path.join(dir_path, "DESCRIPTION.txt")
+    
+    if os.path.exists(readme_path):
+        try:
+            with open(readme_path, 'r', encoding='utf-8') as f:
+                return f.readline().strip()  # Use the first line of README.md
+        except Exception:
+            pass
+    elif os.path.exists(description_path):
+        try:
+            with open(description_path, 'r', encoding='utf-8') as f:
+                return f.readline().strip()  # Use the first line of DESCRIPTION.txt
+        except Exception:
+            pass
+    return None
@@ -0,0 +1,31 @@
+import os
+import requests
+import zipfile
+import tempfile
+from repo_url import parse_github_url
+
+def download_repo(url):
+    """Download repository as ZIP and return extracted directory path."""
+    owner, repo, branch = parse_github_url(url)
+    zip_url = f"https://github.com/{owner}/{repo}/archive/refs/heads/{branch}.zip"
+    
+    response = requests.get(zip_url, stream=True)
+    if response.status_code != 200:
+        raise Exception(f"Failed to download repository: {response.status_code}")
+    
+    temp_dir = tempfile.TemporaryDirectory()
+    zip_path = os.path.join(temp_dir.name, 'repo.zip')
+    
+    with open(zip_path, 'wb') as f:
+        for chunk in response.iter_content(chunk_size=8192):
+            if chunk:
+                f.write(chunk)
+    
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        zip_ref.extractall(temp_dir.name)
+    
+    extracted_folder = os.path.join(temp_dir.name, f"{repo}-{branch}")
+    if not os.path.exists(extracted_folder):
+        extracted_folder = os.path.join(temp_dir.name, os.listdir(temp_dir.name)[0])
+    
+    return extracted_folder, temp_dir
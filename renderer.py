@@ -0,0 +1,56 @@
+import os
+import sys
+from colorama import Fore, Back, Style, init
+
+# Initialize colorama
+init(autoreset=True)
+
+# ASCII Art for GitNoodle
+GITNOODLE_ART = f"""
+{Fore.CYAN}   ____ _ _   _   _       _      _ 
+  / ___(_) |_| | | |_   _| | ___| |
+ | |  _| | __| |_| | | | | |/ _ \\ |
+ | |_| | | |_|  _  | |_| | |  __/_|
+  \\____|_|\\__|_| |_|\\__,_|_|\\___(_)
+{Style.RESET_ALL}
+"""
+
+def print_banner():
+    """Print the GitNoodle banner and welcome message."""
+    print(GITNOODLE_ART)
+    print(f"{Fore.MAGENTA}Welcome to {Fore.CYAN}GitNoodle{Fore.MAGENTA}! Let's explore your repository.{Style.RESET_ALL}\n")
+
+def print_heading(text):
+    """Print a section heading."""
+    print(f"\n{Fore.CYAN}{text}{Style.RESET_ALL}")
+
+def print_error(error):
+    """Print an error message."""
+    print(f"{Fore.RED}Error: {error}{Style.RESET_ALL}", file=sys.stderr)
+
+def print_structure(path, base_path, describe_file, describe_dir, indent=0, score=0):
+    """Recursively print directory structure with simple descriptions and update score."""
+    for item in sorted(os.listdir(path)):
+        item_path = os.path.join(path, item)
+        description = None
+        
+        if os.path.isdir(item_path):
+            description = describe_dir(item_path)
+            print(f"{' ' * indent}{Fore.GREEN}📁 {item}/{Style.RESET_ALL} {Fore.YELLOW}{f'# {description}' if description else ''}{Style.RESET_ALL}")
+            score = print_structure(item_path, base_path, describe_file, describe_dir, indent + 4, score + 1)
+        else:
+            description = describe_file(item_path)
+            print(f"{' ' * indent}{Fore.BLUE}📄 {item}{Style.RESET_ALL} {Fore.YELLOW}{f'# {description}' if description else ''}{Style.RESET_ALL}")
+            score += 1
+    
+    return score
+
+def print_score(score):
+    """Print the final score with an encouraging message."""
+    print(f"\n{Fore.GREEN}🎉 You scored {Fore.YELLOW}{score} points{Fore.GREEN}! 🎉{Style.RESET_ALL}")
+    if score > 50:
+        print(f"{Fore.CYAN}Wow, you're a GitNoodle master! 🏆{Style.RESET_ALL}")
+    elif score > 20:
+        print(f"{Fore.CYAN}Great job! You're getting the hang of it. 🌟{Style.RESET_ALL}")
+    else:
+        print(f"{Fore.CYAN}Nice start! Keep exploring. 🚀{Style.RESET_ALL}")
@@ -0,0 +1,31 @@
+from urllib.parse import urlparse
+
+def parse_github_url(url):
+    """Parse GitHub URL to extract owner, repository, and branch."""
+    parsed = urlparse(url)
+    if parsed.scheme not in ('http', 'https') or parsed.hostname not in ('github.com', 'www.github.com'):
+        raise ValueError(f"not a GitHub URL: {url}")
+
+    path_parts = [part for part in parsed.path.strip('/').split('/') if part]
+    if len(path_parts) < 2:
+        raise ValueError(f"GitHub URL must include an owner and a repository: {url}")
+    
+    owner = path_parts[0]
+    repo = path_parts[1]
+    branch = 'main'
+    
+    try:
+        tree_index = path_parts.index('tree')
+        branch = path_parts[tree_index + 1]
+    except (ValueError, IndexError):
+        pass  # Use default branch if 'tree' not found
+    
+    return owner, repo, branch
+
+def is_github_url(url):
+    """Return True if url is an http(s) GitHub URL with an owner and a repository."""
+    try:
+        parse_github_url(url)
+    except ValueError:
+        return False
+    return True